@@ -39,6 +39,7 @@ def check_and_install_dependencies():
     # Required packages
     base_packages = [
         ("requests", "HTTP client for API calls"),
+        ("numpy", "Health data aggregation"),
         ("matplotlib", "Charts and plotting"),
         ("google-cloud-logging", "Google Cloud integration")
     ]
@@ -4,14 +4,23 @@ Health monitoring interface
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, font
+from tkinter import ttk, font
 import threading
+import queue
+import functools
+from concurrent.futures import Future
 import time
 import os
+import sys
 import subprocess
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
 import json
+from bisect import bisect_right
+from collections import Counter
+from itertools import chain, count
+
+import numpy as np
 
 # ---------- Supabase setup ----------
 from dotenv import load_dotenv
@@ -19,6 +28,11 @@ load_dotenv()
 
 try:
     from supabase import create_client, Client
+    try:
+        from supabase import AuthApiError, AuthSessionMissingError
+    except ImportError:
+        # Older clients only expose these from gotrue
+        from gotrue.errors import AuthApiError, AuthSessionMissingError
     SUPABASE_AVAILABLE = True
     
     SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -40,14 +54,77 @@ except ImportError:
     SUPABASE_AVAILABLE = False
     supabase = None
 
+# Saved session tokens so returning users skip the sign-in form
+SESSION_FILE = os.path.join(
+    os.getenv("APPDATA") or os.path.join(os.path.expanduser("~"), ".config"),
+    "straightup",
+    "session.json"
+)
+
+def save_session(session):
+    """Persist session tokens, readable only by the current user"""
+    try:
+        os.makedirs(os.path.dirname(SESSION_FILE), exist_ok=True)
+        fd = os.open(SESSION_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # The mode above only applies when the file is created
+        os.chmod(SESSION_FILE, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({
+                'access_token': session.access_token,
+                'refresh_token': session.refresh_token
+            }, f)
+    except Exception as e:
+        print(f"⚠️ Could not save session: {e}")
+
+def clear_saved_session():
+    """Remove persisted session tokens"""
+    try:
+        os.remove(SESSION_FILE)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"⚠️ Could not remove saved session: {e}")
+
 class AuthState:
     def __init__(self):
         self.session = None
         self.user = None
+        self.restore_session()
 
     def is_authenticated(self) -> bool:
         return self.session is not None and self.user is not None
 
+    def restore_session(self) -> bool:
+        """Restore a saved session instead of signing in again"""
+        if not SUPABASE_AVAILABLE or not supabase or not os.path.exists(SESSION_FILE):
+            return False
+            
+        try:
+            with open(SESSION_FILE, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            res = supabase.auth.set_session(saved['access_token'], saved['refresh_token'])
+            self.session = res.session
+            self.user = res.user
+            # Tokens may have been refreshed
+            save_session(res.session)
+            print("✅ Restored saved session")
+            return True
+        except (KeyError, TypeError, ValueError, AuthSessionMissingError) as e:
+            # Corrupt or incomplete session file
+            print(f"⚠️ Saved session is invalid: {e}")
+            clear_saved_session()
+            return False
+        except AuthApiError as e:
+            # Only drop the tokens when Supabase actually rejected them
+            print(f"⚠️ Saved session could not be restored: {e}")
+            if (getattr(e, 'status', None) or 400) < 500:
+                clear_saved_session()
+            return False
+        except Exception as e:
+            # Offline or server trouble - keep the tokens for the next launch
+            print(f"⚠️ Saved session could not be restored: {e}")
+            return False
+
 AUTH = AuthState()
 
 def supabase_sign_in(email: str, password: str):
@@ -61,6 +138,7 @@ def supabase_sign_in(email: str, password: str):
         res = supabase.auth.sign_in_with_password({"email": email, "password": password})
         AUTH.session = res.session
         AUTH.user = res.user
+        save_session(res.session)
         return True, None
     except Exception as e:
         return False, str(e)
@@ -86,6 +164,7 @@ def supabase_sign_out():
         except:
             pass
     
+    clear_saved_session()
     AUTH.session = None
     AUTH.user = None
 
@@ -101,6 +180,87 @@ except ImportError:
     CLOUD_LOGGING_AVAILABLE = False
     print("⚠️ Google Cloud logging not available")
 
+# Minimum overall score for each grade, lowest first
+_GRADE_THRESHOLDS = (55, 65, 75, 85)
+_GRADES = 'FDCBA'
+
+def _grade(overall: float) -> str:
+    """Map an overall wellness score to a letter grade"""
+    return _GRADES[bisect_right(_GRADE_THRESHOLDS, overall)]
+
+# Live metrics in display order with their good/warn thresholds;
+# a direction of -1 means lower readings are better
+_LIVE_KEYS = ('postureScore', 'focusScore', 'noiseLevel', 'phoneUsage')
+_LIVE_DIRECTION = np.array([1, 1, -1, -1])
+_LIVE_GOOD = np.array([0.7, 0.7, 0.3, 300]) * _LIVE_DIRECTION
+_LIVE_WARN = np.array([0.4, 0.4, 0.6, 900]) * _LIVE_DIRECTION
+
+# One record per health log entry; recommendations stay Python lists
+HEALTH_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[us]'),
+    ('focus', 'f8'),
+    ('posture', 'f8'),
+    ('phone', 'f8'),
+    ('noise', 'f8'),
+    ('cycle', 'i4'),
+    ('recommendations', object)
+])
+
+class CloudLogBatcher:
+    """Coalesces Cloud Logging reads that arrive close together into one query"""
+    
+    def __init__(self, fetch, delay_threshold_millis: int = 50, element_count_threshold: int = 8):
+        self._fetch = fetch
+        self._delay = delay_threshold_millis / 1000
+        self._element_count_threshold = element_count_threshold
+        self._lock = threading.Lock()
+        self._queue: List[tuple] = []
+        self._timer: Optional[threading.Timer] = None
+    
+    def enqueue(self, hours: int, limit: int, callback):
+        """Queue a read; callback(data, error) runs once the batch is fetched"""
+        with self._lock:
+            self._queue.append((hours, limit, callback))
+            flush_now = len(self._queue) >= self._element_count_threshold
+            if not flush_now and self._timer is None:
+                self._timer = threading.Timer(self._delay, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self._flush()
+    
+    def _flush(self):
+        """Run one query covering every queued read and fan out the results"""
+        with self._lock:
+            batch, self._queue = self._queue, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not batch:
+            return
+        
+        max_hours = max(hours for hours, _, _ in batch)
+        max_limit = max(limit for _, limit, _ in batch)
+        try:
+            data = self._fetch(max_hours, max_limit)
+        except Exception as e:
+            for _, _, callback in batch:
+                callback(None, e)
+            return
+        
+        # Entries are newest first, so a narrower read is a prefix of the wider one
+        now = datetime.utcnow()
+        for hours, limit, callback in batch:
+            try:
+                if hours != max_hours:
+                    cutoff = np.datetime64(now - timedelta(hours=hours))
+                    limit = min(limit, int(np.count_nonzero(data['timestamp'] >= cutoff)))
+                subset = data[:limit]
+            except Exception as e:
+                callback(None, e)
+                continue
+            callback(subset, None)
+
 class HealthDataManager:
     """Manages health data retrieval from Google Cloud"""
     
@@ -108,104 +268,211 @@ class HealthDataManager:
         self.cloud_logging_client = None
         self.logger_name = 'straightup-adk-production'
         
-        if CLOUD_LOGGING_AVAILABLE:
-            try:
-                self.cloud_logging_client = cloud_logging.Client(project='perfect-entry-473503-j1')
-                print("🌐 Google Cloud logging client initialized")
-            except Exception as e:
-                print(f"⚠️ Cloud logging initialization failed: {e}")
+        # Static part of the Cloud Logging filter; only the time window varies
+        self._filter_template = (
+            f'logName="projects/perfect-entry-473503-j1/logs/{self.logger_name}"'
+            ' AND timestamp>="{start}Z" AND timestamp<="{end}Z"'
+            ' AND jsonPayload.source="adk_production_system"'
+        )
+        
+        # Fetched data keyed by hours -> (fetched_at, limit, data, version);
+        # a smaller limit for the same window is served by slicing
+        self._cache: Dict[int, tuple] = {}
+        self._cache_ttl = 30.0
+        self._versions = count(1)
+        
+        # Computed summaries keyed by hours -> (data version, summary)
+        self._summary_cache: Dict[int, tuple] = {}
+        
+        # At most one background prefetch in flight: (hours, limit, Future)
+        self._pending: Optional[tuple] = None
+        
+        # Concurrent reads share one list_entries call
+        self._batcher = CloudLogBatcher(self._fetch_raw)
+        
+        # Client creation probes credentials, so defer it to the first query
+        self._client_lock = threading.Lock()
+        self._client_initialized = False
     
+    def _client(self):
+        """Create the Cloud Logging client on first use"""
+        with self._client_lock:
+            if not self._client_initialized:
+                self._client_initialized = True
+                if CLOUD_LOGGING_AVAILABLE:
+                    try:
+                        self.cloud_logging_client = cloud_logging.Client(project='perfect-entry-473503-j1')
+                        print("🌐 Google Cloud logging client initialized")
+                    except Exception as e:
+                        print(f"⚠️ Cloud logging initialization failed: {e}")
+            return self.cloud_logging_client
+    
+    def invalidate(self):
+        """Drop cached data so the next call queries Google Cloud again"""
+        self._cache.clear()
+        self._summary_cache.clear()
 
-    def get_recent_health_data(self, hours: int = 24, limit: int = 100) -> List[Dict[str, Any]]:
-        """Fetch recent health data from Google Cloud Logging"""
-        if not self.cloud_logging_client:
+    def get_recent_health_data(self, hours: int = 24, limit: int = 100) -> np.ndarray:
+        """Fetch recent health data from Google Cloud Logging as a HEALTH_DTYPE array"""
+        return self._get_data(hours, limit)[1]
+    
+    def _get_data(self, hours: int, limit: int) -> tuple:
+        """Return (data version, data); version 0 means nothing was fetched"""
+        if not self._client():
             print("⚠️ No cloud logging client - returning empty data")
-            return []
+            return 0, np.empty(0, dtype=HEALTH_DTYPE)
+        
+        cached = self._cache.get(hours)
+        if cached:
+            fetched_at, cached_limit, data, version = cached
+            age = time.monotonic() - fetched_at
+            # A short result means the window holds no more entries
+            covers = limit <= cached_limit or len(data) < cached_limit
+            if covers and age < self._cache_ttl:
+                # Refresh in the background so the next call finds fresh data
+                if age >= self._cache_ttl / 2:
+                    self._prefetch(hours, cached_limit)
+                return version, data[:limit]
+            limit_to_fetch = max(limit, cached_limit)
+        else:
+            limit_to_fetch = limit
         
         try:
-            # Calculate time range
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(hours=hours)
-            
-            # Query Google Cloud Logging
-            filter_str = f'''
-                logName="projects/perfect-entry-473503-j1/logs/{self.logger_name}"
-                AND timestamp >= "{start_time.isoformat()}Z"
-                AND timestamp <= "{end_time.isoformat()}Z"
-                AND jsonPayload.source="adk_production_system"
-            '''
-            
-            entries = list(self.cloud_logging_client.list_entries(
-                filter_=filter_str,
-                order_by=cloud_logging.DESCENDING,
-                max_results=limit
-            ))
-            
-            health_data = []
-            for entry in entries:
-                if hasattr(entry, 'payload') and isinstance(entry.payload, dict):
-                    data_point = {
-                        'timestamp': entry.timestamp.isoformat() if entry.timestamp else datetime.utcnow().isoformat(),
-                        'focus_score': entry.payload.get('focus_score', 0.5),
-                        'posture_score': entry.payload.get('posture_score', 0.5),
-                        'phone_usage_seconds': entry.payload.get('phone_usage_seconds', 0.0),
-                        'noise_level': entry.payload.get('noise_level', 0.3),
-                        'recommendations': entry.payload.get('recommendations', []),
-                        'cycle': entry.payload.get('cycle', 0),
-                        'agent_status': entry.payload.get('agent_status', 'unknown')
-                    }
-                    health_data.append(data_point)
-            
-            print(f"📊 Retrieved {len(health_data)} health data points from Google Cloud")
-            return health_data
+            # Reuse an in-flight prefetch instead of issuing a second query
+            pending = self._pending
+            if pending and pending[0] == hours and pending[1] >= limit and not pending[2].done():
+                version, data = pending[2].result()
+            else:
+                version, data = self._fetch(hours, limit_to_fetch)
+            return version, data[:limit]
             
         except Exception as e:
             print(f"⚠️ Error fetching from Google Cloud: {e}")
             print("📊 Returning empty data - no fake data allowed")
-            return []
+            return 0, np.empty(0, dtype=HEALTH_DTYPE)
+    
+    def _prefetch(self, hours: int, limit: int):
+        """Start a background fetch unless one is already running"""
+        pending = self._pending
+        if pending and not pending[2].done():
+            return
+        future = Future()
+        
+        def run():
+            try:
+                future.set_result(self._fetch(hours, limit))
+            except Exception as e:
+                future.set_exception(e)
+        
+        self._pending = (hours, limit, future)
+        # Daemon like the other workers so a slow query never holds up exit
+        threading.Thread(target=run, daemon=True).start()
+    
+    def _fetch(self, hours: int, limit: int) -> tuple:
+        """Fetch through the batcher, cache the result and return (version, data)"""
+        done = threading.Event()
+        result = {}
+        
+        def deliver(data, error):
+            result['data'], result['error'] = data, error
+            done.set()
+        
+        self._batcher.enqueue(hours, limit, deliver)
+        done.wait()
+        if result['error'] is not None:
+            raise result['error']
+        
+        version = next(self._versions)
+        self._cache[hours] = (time.monotonic(), limit, result['data'], version)
+        return version, result['data']
+    
+    def _fetch_raw(self, hours: int, limit: int) -> np.ndarray:
+        """Query Google Cloud Logging"""
+        # Calculate time range
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(hours=hours)
+        
+        # Query Google Cloud Logging
+        filter_str = self._filter_template.format(start=start_time.isoformat(), end=end_time.isoformat())
+        
+        # Iterate pages lazily straight into a preallocated array
+        entries = self._client().list_entries(
+            filter_=filter_str,
+            order_by=cloud_logging.DESCENDING,
+            max_results=limit,
+            page_size=min(limit, 1000)  # API maximum page size
+        )
+        
+        health_data = np.empty(limit, dtype=HEALTH_DTYPE)
+        count = 0
+        for entry in entries:
+            if count >= limit:
+                break
+            if hasattr(entry, 'payload') and isinstance(entry.payload, dict):
+                payload = entry.payload
+                # Store naive UTC; Cloud Logging timestamps are timezone-aware
+                timestamp = (
+                    entry.timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+                    if entry.timestamp else end_time
+                )
+                health_data[count] = (
+                    timestamp,
+                    payload.get('focus_score', 0.5),
+                    payload.get('posture_score', 0.5),
+                    payload.get('phone_usage_seconds', 0.0),
+                    payload.get('noise_level', 0.3),
+                    payload.get('cycle', 0),
+                    # The same few messages repeat across entries; share one copy
+                    [sys.intern(r) if isinstance(r, str) else r for r in payload.get('recommendations', [])]
+                )
+                count += 1
+        health_data = health_data[:count]
+        
+        print(f"📊 Retrieved {len(health_data)} health data points from Google Cloud")
+        return health_data
     
     def get_health_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Get aggregated health summary statistics"""
-        data = self.get_recent_health_data(hours)
+        version, data = self._get_data(hours, 100)
         
-        if not data:
+        if not len(data):
             return {
                 'status': 'no_data',
                 'message': 'No health data available'
             }
         
+        # Only recompute when the underlying data was refetched
+        cached = self._summary_cache.get(hours)
+        if cached and cached[0] == version:
+            return cached[1]
+        
         # Calculate averages and trends
         total_points = len(data)
-        avg_focus = sum(d['focus_score'] for d in data) / total_points
-        avg_posture = sum(d['posture_score'] for d in data) / total_points
-        total_phone_time = sum(d['phone_usage_seconds'] for d in data)
-        avg_noise = sum(d['noise_level'] for d in data) / total_points
-        
-        # Get recent vs older data for trends
-        recent_data = data[:total_points//3] if total_points > 6 else data
-        older_data = data[total_points//3:] if total_points > 6 else data
-        
-        recent_focus = sum(d['focus_score'] for d in recent_data) / len(recent_data) if recent_data else avg_focus
-        older_focus = sum(d['focus_score'] for d in older_data) / len(older_data) if older_data else avg_focus
+        focus = data['focus']
+        avg_focus = float(focus.mean())
+        avg_posture = float(data['posture'].mean())
+        total_phone_time = float(data['phone'].sum())
+        avg_noise = float(data['noise'].mean())
+        
+        # Compare recent vs older data for trends
+        if total_points > 6:
+            split = total_points // 3
+            recent_focus = float(focus[:split].mean())
+            older_focus = float(focus[split:].mean())
+        else:
+            recent_focus = older_focus = avg_focus
         
         focus_trend = 'improving' if recent_focus > older_focus else 'declining' if recent_focus < older_focus else 'stable'
         
-        # Collect all recommendations
-        all_recommendations = []
-        for entry in data:
-            all_recommendations.extend(entry.get('recommendations', []))
-        
-        # Count recommendation frequency
-        rec_counts = {}
-        for rec in all_recommendations:
-            rec_counts[rec] = rec_counts.get(rec, 0) + 1
-        
-        top_recommendations = sorted(rec_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        # Count recommendation frequency across all entries
+        top_recommendations = Counter(
+            chain.from_iterable(data['recommendations'])
+        ).most_common(5)
         
         # Generate live data format from most recent entry
         live_data = self._generate_live_data_from_recent(data)
         
-        return {
+        summary = {
             'status': 'success',
             'data_points': total_points,
             'time_range_hours': hours,
@@ -225,7 +492,7 @@ class HealthDataManager:
             },
             'top_recommendations': [{'text': rec, 'count': count} for rec, count in top_recommendations],
             'health_grade': self._calculate_health_grade(avg_focus, avg_posture, total_phone_time, avg_noise),
-            'last_updated': data[0]['timestamp'] if data else datetime.utcnow().isoformat(),
+            'last_updated': data['timestamp'][0].item().replace(tzinfo=timezone.utc).isoformat(),
             'live_data': live_data,
             'metrics': {
                 'distraction_level': round((1 - avg_focus) * 100, 1),
@@ -233,10 +500,12 @@ class HealthDataManager:
                 'posture_score': round(avg_posture * 100, 1)
             }
         }
+        self._summary_cache[hours] = (version, summary)
+        return summary
     
-    def _generate_live_data_from_recent(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _generate_live_data_from_recent(self, data: np.ndarray) -> Dict[str, Any]:
         """Generate live data format from recent entries"""
-        if not data:
+        if not len(data):
             return {
                 'postureScore': {'value': '75%', 'status': 'good'},
                 'phoneUsage': {'value': '2.3 min', 'status': 'ok'},
@@ -245,30 +514,25 @@ class HealthDataManager:
             }
         
         # Use most recent 5 entries for live data
-        recent_entries = data[:5]
+        recent = data[:5]
+        
+        readings = np.array([
+            recent['posture'].mean(),
+            recent['focus'].mean(),
+            recent['noise'].mean(),
+            recent['phone'].sum()
+        ])
+        
+        # Thresholds are pre-signed, so one comparison works for both directions
+        signed = readings * _LIVE_DIRECTION
+        statuses = np.select([signed > _LIVE_GOOD, signed > _LIVE_WARN], ['good', 'warn'], 'bad')
         
-        avg_posture = sum(d['posture_score'] for d in recent_entries) / len(recent_entries)
-        avg_focus = sum(d['focus_score'] for d in recent_entries) / len(recent_entries)
-        avg_noise = sum(d['noise_level'] for d in recent_entries) / len(recent_entries)
-        total_phone = sum(d['phone_usage_seconds'] for d in recent_entries)
+        posture_pct, focus_pct, noise_pct = (readings[:3] * 100).astype(int)
+        values = (f"{posture_pct}%", f"{focus_pct}%", f"{noise_pct}%", f"{readings[3] / 60:.1f} min")
         
         return {
-            'postureScore': {
-                'value': f"{int(avg_posture * 100)}%",
-                'status': 'good' if avg_posture > 0.7 else 'warn' if avg_posture > 0.4 else 'bad'
-            },
-            'focusScore': {
-                'value': f"{int(avg_focus * 100)}%",
-                'status': 'good' if avg_focus > 0.7 else 'warn' if avg_focus > 0.4 else 'bad'
-            },
-            'noiseLevel': {
-                'value': f"{int(avg_noise * 100)}%",
-                'status': 'good' if avg_noise < 0.3 else 'warn' if avg_noise < 0.6 else 'bad'
-            },
-            'phoneUsage': {
-                'value': f"{total_phone / 60:.1f} min",
-                'status': 'good' if total_phone < 300 else 'warn' if total_phone < 900 else 'bad'
-            }
+            key: {'value': value, 'status': str(status)}
+            for key, value, status in zip(_LIVE_KEYS, values, statuses)
         }
     
     def _calculate_health_grade(self, focus: float, posture: float, phone_time: float, noise: float) -> str:
@@ -280,19 +544,98 @@ class HealthDataManager:
         
         overall = (focus_score + posture_score - phone_penalty - noise_penalty) / 2
         
-        if overall >= 85:
-            return 'A'
-        elif overall >= 75:
-            return 'B'
-        elif overall >= 65:
-            return 'C'
-        elif overall >= 55:
-            return 'D'
-        else:
-            return 'F'
+        return _grade(overall)
     
 
 
+@functools.lru_cache(maxsize=None)
+def _font(family: str, size: int, weight: str = "normal") -> font.Font:
+    """Shared Font instance - each Font() creates a new named Tcl font"""
+    return font.Font(family=family, size=size, weight=weight)
+
+
+def throttle(interval_ms: int):
+    """Run a method at most once per interval; calls in between collapse into
+    one trailing call with the latest arguments, scheduled on ``self.root``.
+    ``method.cancel(self)`` drops a trailing call that hasn't run yet."""
+    def decorator(method):
+        last_attr = f"_{method.__name__}_last_call"
+        pending_attr = f"_{method.__name__}_pending_args"
+        after_attr = f"_{method.__name__}_after_id"
+        
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            if getattr(self, pending_attr, None) is not None:
+                # A trailing call is already scheduled - it will use these args
+                setattr(self, pending_attr, args)
+                return
+            
+            elapsed_ms = (time.monotonic() - getattr(self, last_attr, float('-inf'))) * 1000
+            if elapsed_ms >= interval_ms:
+                setattr(self, last_attr, time.monotonic())
+                method(self, *args)
+                return
+            
+            def trailing():
+                latest = getattr(self, pending_attr)
+                setattr(self, pending_attr, None)
+                setattr(self, after_attr, None)
+                setattr(self, last_attr, time.monotonic())
+                method(self, *latest)
+            
+            setattr(self, pending_attr, args)
+            setattr(self, after_attr, self.root.after(int(interval_ms - elapsed_ms), trailing))
+        
+        def cancel(self):
+            after_id = getattr(self, after_attr, None)
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+            setattr(self, after_attr, None)
+            setattr(self, pending_attr, None)
+        
+        wrapper.cancel = cancel
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def get_friendly_name(key: str) -> str:
+    """Convert API key to friendly display name"""
+    names = {
+        'postureScore': 'Posture',
+        'phoneUsage': 'Phone',
+        'noiseLevel': 'Noise',
+        'focusScore': 'Focus'
+    }
+    return names.get(key, key)
+
+
+@functools.lru_cache(maxsize=None)
+def get_metric_icon(key: str) -> str:
+    """Get icon for metric"""
+    icons = {
+        'postureScore': '🦴',
+        'phoneUsage': '📱',
+        'noiseLevel': '🔊',
+        'focusScore': '🎯'
+    }
+    return icons.get(key, '•')
+
+
+@functools.lru_cache(maxsize=None)
+def get_chip_status(status: str) -> str:
+    """Convert API status to chip status"""
+    status_map = {
+        'good': 'good',
+        'ok': 'good',
+        'warn': 'warn',
+        'warning': 'warn',
+        'bad': 'bad',
+        'error': 'bad'
+    }
+    return status_map.get(status.lower(), 'muted')
+
+
 class ModernTkinterApp:
     """Modern desktop app using pure Tkinter with web UI styling"""
     
@@ -313,9 +656,27 @@ class ModernTkinterApp:
             'accent2': '#22C55E',
             'danger': '#ef4444',
             'warn': '#f59e0b',
-            'panel': '#0F1626'
+            'panel': '#0F1626',
+            'accent_active': '#3730a3'
         }
         
+        # Chip status -> (foreground, border)
+        self._chip_palette = {
+            'good': (self.colors['accent2'], self.colors['accent2']),
+            'warn': (self.colors['warn'], self.colors['warn']),
+            'bad': (self.colors['danger'], self.colors['danger']),
+            'muted': (self.colors['muted'], self.colors['border'])
+        }
+        
+        # Shared options for bordered card and panel frames
+        self._card_kwargs = dict(
+            bg=self.colors['card'],
+            relief='solid',
+            bd=1,
+            highlightbackground=self.colors['border']
+        )
+        self._panel_kwargs = dict(self._card_kwargs, bg=self.colors['panel'])
+        
         # Setup styles
         self.setup_styles()
         
@@ -329,7 +690,16 @@ class ModernTkinterApp:
         self.session_elapsed = 0
         self.timer_id = None
         self.auto_refresh = False
+        self._refresh_timer_id = None
+        self._refresh_in_flight = False
         self.current_data = None
+        self._pending_progress = []
+        self._ui_queue = queue.Queue()  # (callable, args) posted by worker threads
+        self._drain_id = None
+        self._last_err_msg = None
+        self._settings_window = None
+        self._error_toast = None
+        self._error_toast_hide_id = None
         self.user_name = ""
         self.today_minutes = 0
         self.adk_process = None  # Track ADK production process
@@ -339,6 +709,9 @@ class ModernTkinterApp:
         self.auth_frame = None
         self.main_app_frame = None
         
+        # Single pump that runs worker-thread results on the UI thread
+        self._drain_queue()
+        
         # Check authentication and setup appropriate UI
         if SUPABASE_AVAILABLE and AUTH.is_authenticated():
             self.authenticated = True
@@ -349,6 +722,14 @@ class ModernTkinterApp:
         # Handle window closing to ensure camera is turned off
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
+    def _card(self, parent, **extra):
+        """Create a bordered frame in the card style"""
+        return tk.Frame(parent, **{**self._card_kwargs, **extra})
+    
+    def _panel(self, parent, **extra):
+        """Create a bordered frame in the panel style"""
+        return tk.Frame(parent, **{**self._panel_kwargs, **extra})
+    
     def setup_styles(self):
         """Setup custom styles and colors"""
         # Configure root
@@ -356,12 +737,14 @@ class ModernTkinterApp:
         
         # Setup fonts
         self.fonts = {
-            'title': font.Font(family="Segoe UI", size=20, weight="bold"),
-            'subtitle': font.Font(family="Segoe UI", size=18, weight="bold"),
-            'body': font.Font(family="Segoe UI", size=12),
-            'small': font.Font(family="Segoe UI", size=10),
-            'timer': font.Font(family="Segoe UI", size=48, weight="bold"),
-            'large': font.Font(family="Segoe UI", size=36, weight="bold")
+            'title': _font("Segoe UI", 20, "bold"),
+            'subtitle': _font("Segoe UI", 18, "bold"),
+            'body': _font("Segoe UI", 12),
+            'small': _font("Segoe UI", 10),
+            'timer': _font("Segoe UI", 48, "bold"),
+            'large': _font("Segoe UI", 36, "bold"),
+            'chip_bold': _font("Segoe UI", 11, "bold"),
+            'summary_bold': _font("Segoe UI", 12, "bold")
         }
         
         # Configure ttk styles
@@ -402,13 +785,25 @@ class ModernTkinterApp:
     
     def setup_auth_ui(self):
         """Setup authentication interface"""
-        # Clear any existing content
-        for widget in self.root.winfo_children():
-            widget.destroy()
-            
+        # Tear down the dashboard but keep the auth widgets for reuse
+        if self.main_app_frame is not None:
+            self._destroy_dashboard()
+            self.main_app_frame = None
+        
+        if self.auth_frame is None or not self.auth_frame.winfo_exists():
+            self._build_auth_widgets()
+        
+        # Fresh form after logout; the button stayed disabled after a successful login
+        self.password_var.set("")
+        self.signup_password_var.set("")
+        self.login_btn.configure(state="normal")
+        self.auth_frame.pack(fill="both", expand=True)
+        self.show_login_form()
+    
+    def _build_auth_widgets(self):
+        """Build the sign-in and sign-up cards once"""
         # Create auth frame
         self.auth_frame = tk.Frame(self.root, bg=self.colors['bg'])
-        self.auth_frame.pack(fill="both", expand=True)
         
         # Center container
         center_frame = tk.Frame(self.auth_frame, bg=self.colors['bg'])
@@ -443,19 +838,20 @@ class ModernTkinterApp:
         )
         title_label.pack(pady=(0, 30))
         
-        # Auth card
-        auth_card = tk.Frame(
-            center_frame,
-            bg=self.colors['card'],
-            relief='solid',
-            bd=1,
-            highlightbackground=self.colors['border'],
-            highlightthickness=1
-        )
-        auth_card.pack(padx=40, pady=20, ipadx=40, ipady=30)
+        # Auth cards - only one is packed at a time
+        cards = {}
+        for name in ('login', 'signup'):
+            cards[name] = self._card(center_frame, highlightthickness=1)
         
-        # Login form
-        self.setup_login_form(auth_card)
+        # Login and signup forms
+        self.setup_login_form(cards['login'])
+        self.setup_signup_form(cards['signup'])
+        
+        self._auth_widgets = {
+            'title': title_label,
+            'login': cards['login'],
+            'signup': cards['signup']
+        }
     
     def setup_login_form(self, parent):
         """Setup login form"""
@@ -521,7 +917,7 @@ class ModernTkinterApp:
         password_entry.pack(pady=(0, 20), ipady=8)
         
         # Login button
-        login_btn = tk.Button(
+        self.login_btn = tk.Button(
             parent,
             text="Sign In",
             font=self.fonts['body'],
@@ -532,7 +928,7 @@ class ModernTkinterApp:
             command=self.handle_login,
             cursor="hand2"
         )
-        login_btn.pack(pady=(0, 15), ipady=12, fill="x")
+        self.login_btn.pack(pady=(0, 15), ipady=12, fill="x")
         
         # Signup link
         signup_frame = tk.Frame(parent, bg=self.colors['card'])
@@ -568,58 +964,21 @@ class ModernTkinterApp:
         )
         self.auth_status.pack(pady=(10, 0))
     
+    def show_login_form(self):
+        """Switch to login form"""
+        widgets = self._auth_widgets
+        widgets['signup'].pack_forget()
+        widgets['title'].configure(text="Welcome to iMPOSTURE")
+        widgets['login'].pack(padx=40, pady=20, ipadx=40, ipady=30)
+        self.auth_status.config(text="")
+    
     def show_signup_form(self):
         """Switch to signup form"""
-        # Clear current auth card
-        for widget in self.auth_frame.winfo_children():
-            widget.destroy()
-            
-        # Recreate center container
-        center_frame = tk.Frame(self.auth_frame, bg=self.colors['bg'])
-        center_frame.place(relx=0.5, rely=0.5, anchor="center")
-        
-        # Logo and title
-        logo_frame = tk.Frame(
-            center_frame,
-            width=48, height=48,
-            bg=self.colors['accent'],
-            relief='solid',
-            bd=1
-        )
-        logo_frame.pack(pady=(0, 20))
-        logo_frame.pack_propagate(False)
-        
-        logo_label = tk.Label(
-            logo_frame,
-            text="⬆",
-            font=self.fonts['subtitle'],
-            fg="white",
-            bg=self.colors['accent']
-        )
-        logo_label.pack(expand=True)
-        
-        title_label = tk.Label(
-            center_frame,
-            text="iMPOSTURE Desktop",
-            font=self.fonts['title'],
-            fg=self.colors['ink'],
-            bg=self.colors['bg']
-        )
-        title_label.pack(pady=(0, 30))
-        
-        # Auth card
-        auth_card = tk.Frame(
-            center_frame,
-            bg=self.colors['card'],
-            relief='solid',
-            bd=1,
-            highlightbackground=self.colors['border'],
-            highlightthickness=1
-        )
-        auth_card.pack(padx=40, pady=20, ipadx=40, ipady=30)
-        
-        # Signup form
-        self.setup_signup_form(auth_card)
+        widgets = self._auth_widgets
+        widgets['login'].pack_forget()
+        widgets['title'].configure(text="iMPOSTURE Desktop")
+        widgets['signup'].pack(padx=40, pady=20, ipadx=40, ipady=30)
+        self.signup_status.config(text="")
     
     def setup_signup_form(self, parent):
         """Setup signup form"""
@@ -685,7 +1044,7 @@ class ModernTkinterApp:
         password_entry.pack(pady=(0, 20), ipady=8)
         
         # Signup button
-        signup_btn = tk.Button(
+        self.signup_btn = tk.Button(
             parent,
             text="Create Account",
             font=self.fonts['body'],
@@ -696,7 +1055,7 @@ class ModernTkinterApp:
             command=self.handle_signup,
             cursor="hand2"
         )
-        signup_btn.pack(pady=(0, 15), ipady=12, fill="x")
+        self.signup_btn.pack(pady=(0, 15), ipady=12, fill="x")
         
         # Login link
         login_frame = tk.Frame(parent, bg=self.colors['card'])
@@ -720,7 +1079,7 @@ class ModernTkinterApp:
             cursor="hand2"
         )
         login_link.pack(side="left")
-        login_link.bind("<Button-1>", lambda e: self.setup_auth_ui())
+        login_link.bind("<Button-1>", lambda e: self.show_login_form())
         
         # Status label for errors
         self.signup_status = tk.Label(
@@ -746,14 +1105,23 @@ class ModernTkinterApp:
             return
             
         self.auth_status.config(text="Signing in...")
-        self.root.update()
+        self.login_btn.configure(state="disabled")
         
+        # Sign in off the UI thread so the window stays responsive
+        threading.Thread(target=self._login_worker, args=(email, password), daemon=True).start()
+    
+    def _login_worker(self, email: str, password: str):
+        """Run sign-in in the background and hand the result to the UI thread"""
         success, error = supabase_sign_in(email, password)
-        
+        self._ui_queue.put((self._apply_login_result, (success, error)))
+    
+    def _apply_login_result(self, success: bool, error: Optional[str]):
+        """Apply sign-in result on the UI thread"""
         if success:
             self.authenticated = True
             self.setup_main_app()
-        else:
+        elif self.login_btn.winfo_exists():
+            self.login_btn.configure(state="normal")
             self.auth_status.config(text=f"Login failed: {error}")
     
     def handle_signup(self):
@@ -774,20 +1142,38 @@ class ModernTkinterApp:
             return
             
         self.signup_status.config(text="Creating account...")
-        self.root.update()
+        self.signup_btn.configure(state="disabled")
         
+        # Sign up off the UI thread so the window stays responsive
+        threading.Thread(target=self._signup_worker, args=(email, password), daemon=True).start()
+    
+    def _signup_worker(self, email: str, password: str):
+        """Run sign-up in the background and hand the result to the UI thread"""
         success, error = supabase_sign_up(email, password)
-        
+        self._ui_queue.put((self._apply_signup_result, (success, error)))
+    
+    def _apply_signup_result(self, success: bool, error: Optional[str]):
+        """Apply sign-up result on the UI thread"""
+        if not self.signup_btn.winfo_exists():
+            return
+        self.signup_btn.configure(state="normal")
         if success:
             self.signup_status.config(text="Account created! Please check email for verification.")
         else:
             self.signup_status.config(text=f"Signup failed: {error}")
     
+    def _destroy_dashboard(self):
+        """Destroy the dashboard along with status updates still queued for it"""
+        self._set_status.cancel(self)
+        self.main_app_frame.destroy()
+    
     def setup_main_app(self):
         """Setup main application interface after authentication"""
-        # Clear any existing content
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        # Hide the auth screen and clear any previous dashboard
+        if self.auth_frame is not None:
+            self.auth_frame.pack_forget()
+        if self.main_app_frame is not None:
+            self._destroy_dashboard()
             
         # Create main app frame
         self.main_app_frame = tk.Frame(self.root, bg=self.colors['bg'])
@@ -799,7 +1185,8 @@ class ModernTkinterApp:
         self.setup_main_content()
         self.setup_refresh_timer()
         
-        # Load initial data
+        # Load initial data into the freshly built widgets
+        self.current_data = None
         self.refresh_data()
     
     def setup_authenticated_header(self):
@@ -882,7 +1269,7 @@ class ModernTkinterApp:
             bd=0,
             activebackground="#dc2626",
             activeforeground="white",
-            command=self.refresh_data
+            command=self.handle_refresh
         )
         refresh_btn.pack(side="right", padx=5)
         
@@ -969,13 +1356,7 @@ class ModernTkinterApp:
     
     def create_badge(self, parent, icon, title, subtitle):
         """Create a badge with icon and text"""
-        badge_frame = tk.Frame(
-            parent,
-            bg=self.colors['card'],
-            relief='solid',
-            bd=1,
-            highlightbackground=self.colors['border']
-        )
+        badge_frame = self._card(parent)
         
         content_frame = tk.Frame(badge_frame, bg=self.colors['card'])
         content_frame.pack(fill="both", expand=True, padx=14, pady=14)
@@ -1007,7 +1388,7 @@ class ModernTkinterApp:
         title_label = tk.Label(
             text_frame,
             text=title,
-            font=font.Font(family="Segoe UI", size=11, weight="bold"),
+            font=self.fonts['chip_bold'],
             fg=self.colors['ink'],
             bg=self.colors['card'],
             anchor="w"
@@ -1042,13 +1423,7 @@ class ModernTkinterApp:
     
     def setup_session_card(self, parent):
         """Setup session control card"""
-        session_card = tk.Frame(
-            parent,
-            bg=self.colors['card'],
-            relief='solid',
-            bd=1,
-            highlightbackground=self.colors['border']
-        )
+        session_card = self._card(parent)
         session_card.pack(side="left", fill="both", expand=True, padx=(0, 8))
         
         # Card content
@@ -1091,13 +1466,7 @@ class ModernTkinterApp:
         self.session_subtitle.pack(fill="x", pady=(0, 8))
         
         # Timer display
-        timer_frame = tk.Frame(
-            card_content,
-            bg=self.colors['panel'],
-            relief='solid',
-            bd=1,
-            highlightbackground="#2a3350"
-        )
+        timer_frame = self._panel(card_content, highlightbackground="#2a3350")
         timer_frame.pack(fill="x", pady=(0, 10))
         
         self.timer_label = tk.Label(
@@ -1172,13 +1541,7 @@ class ModernTkinterApp:
         # self.camera_off_btn.pack(side="left", padx=5)
         
         # Status pill
-        status_frame = tk.Frame(
-            controls_frame,
-            bg=self.colors['panel'],
-            relief='solid',
-            bd=1,
-            highlightbackground=self.colors['border']
-        )
+        status_frame = self._panel(controls_frame)
         status_frame.pack(side="right")
         
         status_content = tk.Frame(status_frame, bg=self.colors['panel'])
@@ -1208,25 +1571,24 @@ class ModernTkinterApp:
     
     def setup_live_summary(self, parent):
         """Setup live wellness summary"""
-        summary_frame = tk.Frame(
-            parent,
-            bg=self.colors['card'],
-            relief='solid',
-            bd=1,
-            highlightbackground=self.colors['border']
-        )
+        c = self.colors
+        card = c['card']
+        ink = c['ink']
+        muted = c['muted']
+        
+        summary_frame = self._card(parent)
         summary_frame.pack(fill="x", pady=(18, 0))
         
         # Header
-        header_frame = tk.Frame(summary_frame, bg=self.colors['card'])
+        header_frame = tk.Frame(summary_frame, bg=card)
         header_frame.pack(fill="x", padx=16, pady=(16, 10))
         
         summary_title = tk.Label(
             header_frame,
             text="Live wellness",
-            font=font.Font(family="Segoe UI", size=12, weight="bold"),
-            fg=self.colors['ink'],
-            bg=self.colors['card']
+            font=self.fonts['summary_bold'],
+            fg=ink,
+            bg=card
         )
         summary_title.pack(side="left")
         
@@ -1234,76 +1596,86 @@ class ModernTkinterApp:
             header_frame,
             text="●",
             font=self.fonts['small'],
-            fg=self.colors['muted'],
-            bg=self.colors['card']
+            fg=muted,
+            bg=card
         )
         self.live_dot.pack(side="right")
         
         # Summary content
-        self.live_summary_frame = tk.Frame(summary_frame, bg=self.colors['card'])
+        self.live_summary_frame = tk.Frame(summary_frame, bg=card)
         self.live_summary_frame.pack(fill="x", padx=16, pady=(0, 16))
         
+        # Chips are built once and reconfigured on every refresh
+        self._chip_pool = [self.create_chip(self.live_summary_frame, "") for _ in range(3)]
+        self._visible_chips = 0
+        
         # Initial loading chip
-        loading_chip = self.create_chip(self.live_summary_frame, "Loading live summary…", "muted")
-        loading_chip.pack(side="left")
+        self._show_chips([("Loading live summary…", "muted", "•")])
     
     def create_chip(self, parent, text, status="muted", icon="•"):
         """Create a status chip"""
-        colors = {
-            'good': {'fg': self.colors['accent2'], 'border': self.colors['accent2']},
-            'warn': {'fg': self.colors['warn'], 'border': self.colors['warn']},
-            'bad': {'fg': self.colors['danger'], 'border': self.colors['danger']},
-            'muted': {'fg': self.colors['muted'], 'border': self.colors['border']}
-        }
-        
-        chip_colors = colors.get(status, colors['muted'])
+        card = self.colors['card']
         
-        chip = tk.Frame(
-            parent,
-            bg=self.colors['card'],
-            relief='solid',
-            bd=1,
-            highlightbackground=chip_colors['border']
-        )
+        chip = self._card(parent)
         
-        content_frame = tk.Frame(chip, bg=self.colors['card'])
+        content_frame = tk.Frame(chip, bg=card)
         content_frame.pack(padx=14, pady=8)
         
         # Icon
         icon_label = tk.Label(
             content_frame,
-            text=icon,
             font=self.fonts['body'],
-            fg=chip_colors['fg'],
-            bg=self.colors['card']
+            bg=card
         )
         icon_label.pack(side="left", padx=(0, 8))
         
         # Text
         text_label = tk.Label(
             content_frame,
-            text=text,
-            font=font.Font(family="Segoe UI", size=11, weight="bold"),
-            fg=chip_colors['fg'],
-            bg=self.colors['card']
+            font=self.fonts['chip_bold'],
+            bg=card
         )
         text_label.pack(side="left")
         
+        # Store references for updates
+        chip.icon_label = icon_label
+        chip.text_label = text_label
+        
+        self._configure_chip(chip, text, status, icon)
         return chip
     
+    def _configure_chip(self, chip, text, status="muted", icon="•"):
+        """Apply text, icon and status colors to an existing chip"""
+        fg, border = self._chip_palette.get(status, self._chip_palette['muted'])
+        
+        chip.configure(highlightbackground=border)
+        chip.icon_label.configure(text=icon, fg=fg)
+        chip.text_label.configure(text=text, fg=fg)
+    
+    def _show_chips(self, specs):
+        """Show one pooled chip per (text, status, icon) spec and hide the rest"""
+        # Visible chips are always a prefix of the pool, so packing in order keeps layout
+        for i, chip in enumerate(self._chip_pool):
+            if i < len(specs):
+                self._configure_chip(chip, *specs[i])
+                if i >= self._visible_chips:
+                    chip.pack(side="left", padx=(0, 12))
+            elif i < self._visible_chips:
+                chip.pack_forget()
+        self._visible_chips = min(len(specs), len(self._chip_pool))
+    
     def setup_wellness_card(self, parent):
         """Setup wellness report card"""
-        wellness_card = tk.Frame(
-            parent,
-            bg=self.colors['card'],
-            relief='solid',
-            bd=1,
-            highlightbackground=self.colors['border']
-        )
+        c = self.colors
+        card = c['card']
+        ink = c['ink']
+        muted = c['muted']
+        
+        wellness_card = self._card(parent)
         wellness_card.pack(side="right", fill="both", expand=True, padx=(8, 0))
         
         # Card content
-        card_content = tk.Frame(wellness_card, bg=self.colors['card'])
+        card_content = tk.Frame(wellness_card, bg=card)
         card_content.pack(fill="both", expand=True, padx=18, pady=18)
         
         # Title
@@ -1311,8 +1683,8 @@ class ModernTkinterApp:
             card_content,
             text="Wellness Report",
             font=self.fonts['subtitle'],
-            fg=self.colors['ink'],
-            bg=self.colors['card'],
+            fg=ink,
+            bg=card,
             anchor="w"
         )
         title_label.pack(fill="x", pady=(0, 10))
@@ -1322,8 +1694,8 @@ class ModernTkinterApp:
             card_content,
             text="Snapshot of posture, focus, distractions, and break habits.",
             font=self.fonts['body'],
-            fg=self.colors['muted'],
-            bg=self.colors['card'],
+            fg=muted,
+            bg=card,
             anchor="w",
             wraplength=400,
             justify="left"
@@ -1331,7 +1703,7 @@ class ModernTkinterApp:
         subtitle_label.pack(fill="x", pady=(0, 8))
         
         # Metrics grid
-        metrics_frame = tk.Frame(card_content, bg=self.colors['card'])
+        metrics_frame = tk.Frame(card_content, bg=card)
         metrics_frame.pack(fill="both", expand=True)
         
         # Configure grid weights
@@ -1356,33 +1728,40 @@ class ModernTkinterApp:
         )
         self.posture_metric.grid(row=1, column=0, sticky="nsew", padx=(0, 6), pady=(6, 0))
         
+        # Metric widgets keyed by their name in the summary 'metrics' dict
+        self._widgets = {
+            'distraction_level': self.distraction_metric,
+            'focus_score': self.focus_metric,
+            'posture_score': self.posture_metric
+        }
+        
         # Empty space for symmetry
-        empty_frame = tk.Frame(metrics_frame, bg=self.colors['card'])
+        empty_frame = tk.Frame(metrics_frame, bg=card)
         empty_frame.grid(row=1, column=1, sticky="nsew", padx=(6, 0), pady=(6, 0))
     
     def create_metric_widget(self, parent, title, hint):
         """Create a metric display widget with progress bar"""
-        metric_frame = tk.Frame(
-            parent,
-            bg=self.colors['panel'],
-            relief='solid',
-            bd=1,
-            highlightbackground=self.colors['border']
-        )
+        c = self.colors
+        panel = c['panel']
+        ink = c['ink']
+        muted = c['muted']
+        accent2 = c['accent2']
+        
+        metric_frame = self._panel(parent)
         
-        content_frame = tk.Frame(metric_frame, bg=self.colors['panel'])
+        content_frame = tk.Frame(metric_frame, bg=panel)
         content_frame.pack(fill="both", expand=True, padx=14, pady=14)
         
         # Header with title and percentage
-        header_frame = tk.Frame(content_frame, bg=self.colors['panel'])
+        header_frame = tk.Frame(content_frame, bg=panel)
         header_frame.pack(fill="x", pady=(0, 6))
         
         title_label = tk.Label(
             header_frame,
             text=title,
-            font=font.Font(family="Segoe UI", size=11, weight="bold"),
-            fg=self.colors['ink'],
-            bg=self.colors['panel'],
+            font=self.fonts['chip_bold'],
+            fg=ink,
+            bg=panel,
             anchor="w"
         )
         title_label.pack(side="left")
@@ -1391,136 +1770,229 @@ class ModernTkinterApp:
             header_frame,
             text="—",
             font=self.fonts['body'],
-            fg=self.colors['muted'],
-            bg=self.colors['panel']
+            fg=muted,
+            bg=panel
         )
         pct_label.pack(side="right")
         
-        # Progress bar container
-        progress_bg = tk.Frame(
+        # Progress bar drawn as a single canvas rectangle
+        progress_canvas = tk.Canvas(
             content_frame,
             height=12,
             bg="#0c1220",
-            relief='solid',
-            bd=1,
+            bd=0,
+            highlightthickness=1,
             highlightbackground="#223055"
         )
-        progress_bg.pack(fill="x", pady=(0, 6))
-        progress_bg.pack_propagate(False)
-        
-        # Progress bar (simulated with colored frame)
-        progress_bar = tk.Frame(
-            progress_bg,
-            height=10,
-            bg=self.colors['accent2']
+        progress_canvas.pack(fill="x", pady=(0, 6))
+        progress_rect = progress_canvas.create_rectangle(
+            1, 1, 1, 11,
+            fill=accent2,
+            width=0
         )
-        progress_bar.pack(side="left", padx=1, pady=1)
         
         # Hint
         hint_label = tk.Label(
             content_frame,
             text=hint,
             font=self.fonts['small'],
-            fg=self.colors['muted'],
-            bg=self.colors['panel'],
+            fg=muted,
+            bg=panel,
             anchor="w"
         )
         hint_label.pack(fill="x")
         
         # Store references for updates
         metric_frame.pct_label = pct_label
-        metric_frame.progress_bar = progress_bar
-        metric_frame.progress_bg = progress_bg
+        metric_frame.progress_canvas = progress_canvas
+        metric_frame.progress_rect = progress_rect
+        
+        # Track the bar width from resize events instead of querying Tk each update
+        metric_frame._canvas_width = 0
+        progress_canvas.bind(
+            '<Configure>',
+            lambda e, mw=metric_frame: setattr(mw, '_canvas_width', e.width)
+        )
         
         return metric_frame
     
-    def update_progress_bar(self, metric_widget, percentage):
-        """Update progress bar width"""
-        bg_width = metric_widget.progress_bg.winfo_width()
-        if bg_width > 1:  # Only update if widget is properly sized
-            bar_width = max(1, int((bg_width - 2) * percentage / 100))
-            metric_widget.progress_bar.configure(width=bar_width)
+    def update_progress_bar(self, metric_widget, percentage) -> bool:
+        """Update progress bar width; returns False if the widget isn't sized yet"""
+        bg_width = metric_widget._canvas_width
+        if bg_width <= 1:
+            return False
+        bar_width = max(1, int((bg_width - 2) * percentage / 100))
+        if getattr(metric_widget, '_last_bar_width', None) != bar_width:
+            metric_widget.progress_canvas.coords(metric_widget.progress_rect, 1, 1, 1 + bar_width, 11)
+            metric_widget._last_bar_width = bar_width
+        return True
+    
+    def _apply_pending_progress(self):
+        """Update queued metric labels and progress bars in a single redraw"""
+        pending, self._pending_progress = self._pending_progress, []
+        unsized = []
+        for metric_widget, pct in pending:
+            self._set_text(metric_widget.pct_label, f"{pct}%")
+            if self.update_progress_bar(metric_widget, pct):
+                metric_widget._last_pct = pct
+            else:
+                unsized.append((metric_widget, pct))
+        
+        # Resolve pending geometry in place rather than waiting on a timer
+        if unsized:
+            self.root.update_idletasks()
+            still_unsized = []
+            for metric_widget, pct in unsized:
+                if self.update_progress_bar(metric_widget, pct):
+                    metric_widget._last_pct = pct
+                else:
+                    still_unsized.append((metric_widget, pct))
+            unsized = still_unsized
+        
+        # An unmapped window still has no size; try again once it is shown
+        if unsized:
+            self._pending_progress = unsized
+            self.root.after(100, self._apply_pending_progress)
     
-    def setup_refresh_timer(self):
+    def setup_refresh_timer(self, delay=5000):
         """Setup auto-refresh timer"""
+        # Keep a single pending timer no matter how many callers re-arm it
+        if self._refresh_timer_id is not None:
+            self.root.after_cancel(self._refresh_timer_id)
+            self._refresh_timer_id = None
         if self.auto_refresh and self.session_running:
-            self.root.after(5000, self.auto_refresh_data)  # Refresh every 5 seconds
+            self._refresh_timer_id = self.root.after(delay, self.auto_refresh_data)  # Refresh every 5 seconds
     
     def auto_refresh_data(self):
         """Auto-refresh data if enabled"""
+        self._refresh_timer_id = None
         if self.auto_refresh and self.session_running:
+            # Nothing is visible while minimized - check back less often
+            if self.root.state() == 'iconic':
+                self.setup_refresh_timer(30000)
+                return
+            # A slow fetch is still running; don't stack another thread on it
+            if self._refresh_in_flight:
+                self.setup_refresh_timer()
+                return
+            # The timer is re-armed by _refresh_done once this fetch finishes
             self.refresh_data()
-            self.setup_refresh_timer()
     
     def refresh_data(self):
         """Refresh health data from backend"""
         if not self.session_running:
             return
-        def fetch_data():
-            try:
-                self.current_data = self.data_manager.get_health_summary()
-                self.root.after(0, self.update_ui)
-            except Exception as e:
-                self.root.after(0, lambda: self.show_error(f"Failed to fetch data: {e}"))
+        self._refresh_in_flight = True
         # Run in background thread
-        thread = threading.Thread(target=fetch_data, daemon=True)
+        thread = threading.Thread(target=self._fetch_data_worker, daemon=True)
         thread.start()
         # Update status
-        self.status_label.configure(text="🔄 Refreshing...")
+        self._set_status("🔄 Refreshing...")
+    
+    def _fetch_data_worker(self):
+        """Fetch the health summary off the UI thread"""
+        try:
+            summary = self.data_manager.get_health_summary()
+            # Summaries are memoized per fetch, so the same object means nothing changed
+            if summary is self.current_data:
+                self._ui_queue.put((self._update_status, ()))
+                return
+            self.current_data = summary
+            self._ui_queue.put((self.update_ui, ()))
+        except Exception as e:
+            self._ui_queue.put((self.show_error, (f"Failed to fetch data: {e}",)))
+        finally:
+            self._ui_queue.put((self._refresh_done, ()))
+    
+    def _drain_queue(self):
+        """Run callbacks queued by worker threads, then poll again"""
+        try:
+            while True:
+                fn, args = self._ui_queue.get_nowait()
+                fn(*args)
+        except queue.Empty:
+            pass
+        finally:
+            # Keep pumping even if a callback raised
+            self._drain_id = self.root.after(100, self._drain_queue)
+    
+    def _refresh_done(self):
+        """Clear the in-flight flag and schedule the next auto-refresh"""
+        self._refresh_in_flight = False
+        self.setup_refresh_timer()
+    
+    def handle_refresh(self):
+        """Handle manual refresh - bypass cached data"""
+        self.data_manager.invalidate()
+        self.refresh_data()
     
     def update_ui(self):
         """Update UI with current data"""
         if not self.current_data or self.current_data.get('status') != 'success':
-            self.status_label.configure(text="🔴 No Data Available")
+            self._set_status("🔴 No Data Available")
             return
         
         data = self.current_data
         
-        # Update status based on ADK system and data availability
-        if self.is_adk_running():
-            self.status_label.configure(text="🟢 ADK System Active")
-        else:
-            self.status_label.configure(text="🟢 Data Available")
+        self._update_status()
         
         # Update metrics
         metrics = data.get('metrics', {})
+        values = {
+            # Distraction level (inverted for display)
+            'distraction_level': 100 - metrics.get('distraction_level', 28),
+            'focus_score': metrics.get('focus_score', 64),
+            'posture_score': metrics.get('posture_score', 75)
+        }
         
-        # Distraction level (inverted for display)
-        dist_pct = metrics.get('distraction_level', 28)
-        display_dist = 100 - dist_pct
-        self.distraction_metric.pct_label.configure(text=f"{display_dist}%")
-        self.root.after(100, lambda: self.update_progress_bar(self.distraction_metric, display_dist))
-        
-        # Focus score
-        focus_pct = metrics.get('focus_score', 64)
-        self.focus_metric.pct_label.configure(text=f"{focus_pct}%")
-        self.root.after(100, lambda: self.update_progress_bar(self.focus_metric, focus_pct))
-        
-        # Posture score
-        posture_pct = metrics.get('posture_score', 75)
-        self.posture_metric.pct_label.configure(text=f"{posture_pct}%")
-        self.root.after(100, lambda: self.update_progress_bar(self.posture_metric, posture_pct))
+        # Apply text and bar widths together in one idle pass, skipping tiles whose value held
+        changed = [
+            (self._widgets[name], pct) for name, pct in values.items()
+            if getattr(self._widgets[name], '_last_pct', None) != pct
+        ]
+        if changed:
+            self._pending_progress = changed
+            self.root.after_idle(self._apply_pending_progress)
         
         # Update live summary
         self.update_live_summary(data.get('live_data', {}))
     
+    def _update_status(self):
+        """Update status based on ADK system and data availability"""
+        # A fetch got through, so the next failure is worth a dialog again
+        self._last_err_msg = None
+        if not self.current_data or self.current_data.get('status') != 'success':
+            self._set_status("🔴 No Data Available")
+        elif self.is_adk_running():
+            self._set_status("🟢 ADK System Active")
+        else:
+            self._set_status("🟢 Data Available")
+    
+    @throttle(250)
+    def _set_status(self, text):
+        """Set the header status text, coalescing rapid flips into one redraw"""
+        if not self.status_label.winfo_exists():
+            return
+        self._set_text(self.status_label, text)
+    
+    def _set_text(self, label, text):
+        """Configure label text only when it changed"""
+        if getattr(label, '_last_text', None) != text:
+            label.configure(text=text)
+            label._last_text = text
+    
     def update_live_summary(self, live_data):
         """Update live wellness summary chips"""
-        # Clear existing chips
-        for widget in self.live_summary_frame.winfo_children():
-            widget.destroy()
-        
         if not live_data:
-            loading_chip = self.create_chip(self.live_summary_frame, "No live data available", "muted")
-            loading_chip.pack(side="left")
+            self._show_chips([("No live data available", "muted", "•")])
             return
         
-        # Create chips for each metric
-        chip_count = 0
-        max_chips = 3  # Limit to prevent overflow
+        # Build chip specs for each metric
+        specs = []
+        max_chips = len(self._chip_pool)  # Limit to prevent overflow
         
         for key, value in live_data.items():
-            if chip_count >= max_chips:
+            if len(specs) >= max_chips:
                 break
                 
             # Extract status and value
@@ -1532,58 +2004,27 @@ class ModernTkinterApp:
                 display_value = str(value)
             
             # Create friendly names and icons
-            display_name = self.get_friendly_name(key)
-            icon = self.get_metric_icon(key)
+            display_name = get_friendly_name(key)
+            icon = get_metric_icon(key)
             
             # Determine chip status
-            chip_status = self.get_chip_status(status)
+            chip_status = get_chip_status(status)
             
             chip_text = f"{display_name}: {display_value}"
-            chip = self.create_chip(self.live_summary_frame, chip_text, chip_status, icon)
-            chip.pack(side="left", padx=(0, 12))
-            
-            chip_count += 1
+            specs.append((chip_text, chip_status, icon))
+        
+        self._show_chips(specs)
         
         # Update live dot color
-        if chip_count > 0:
+        if specs:
             self.live_dot.configure(fg=self.colors['accent2'])
         else:
             self.live_dot.configure(fg=self.colors['muted'])
     
-    def get_friendly_name(self, key):
-        """Convert API key to friendly display name"""
-        names = {
-            'postureScore': 'Posture',
-            'phoneUsage': 'Phone',
-            'noiseLevel': 'Noise',
-            'focusScore': 'Focus'
-        }
-        return names.get(key, key)
-    
-    def get_metric_icon(self, key):
-        """Get icon for metric"""
-        icons = {
-            'postureScore': '🦴',
-            'phoneUsage': '📱',
-            'noiseLevel': '🔊',
-            'focusScore': '🎯'
-        }
-        return icons.get(key, '•')
-    
-    def get_chip_status(self, status):
-        """Convert API status to chip status"""
-        status_map = {
-            'good': 'good',
-            'ok': 'good',
-            'warn': 'warn',
-            'warning': 'warn',
-            'bad': 'bad',
-            'error': 'bad'
-        }
-        return status_map.get(status.lower(), 'muted')
-    
     def start_adk_production(self):
         """Start the ADK production webcam monitoring system"""
+        from tkinter import messagebox
+        
         try:
             # Path to the backend directory
             current_file = os.path.abspath(__file__)
@@ -1650,7 +2091,7 @@ class ModernTkinterApp:
             self.session_subtitle.configure(text="ADK system active - webcam monitoring running in background!")
             
             # Update status indicator
-            self.status_label.configure(text="🔴 ADK System Running (Background)")
+            self._set_status("🔴 ADK System Running (Background)")
             
             # Check logs after a brief delay
             self.root.after(3000, self.check_adk_logs)  # Check logs after 3 seconds
@@ -1703,11 +2144,11 @@ class ModernTkinterApp:
             
             # Update UI status if available
             if hasattr(self, 'status_label'):
-                self.status_label.configure(text="Camera OFF")
+                self._set_status("Camera OFF")
                 
                 # Update UI to reflect camera is off
                 if hasattr(self, 'status_label'):
-                    self.status_label.configure(text="🔴 Camera Off")
+                    self._set_status("🔴 Camera Off")
                 
         except Exception as e:
             print(f"⚠️ Error stopping ADK production: {e}")
@@ -1770,7 +2211,7 @@ class ModernTkinterApp:
             
             # Update UI
             if hasattr(self, 'status_label'):
-                self.status_label.configure(text="📷 Camera OFF")
+                self._set_status("📷 Camera OFF")
                 
         except Exception as e:
             print(f"⚠️ Error turning off camera: {e}")
@@ -1793,6 +2234,8 @@ class ModernTkinterApp:
         time.sleep(0.5)
         
         print("🚪 StraightUp app closed - camera monitoring disabled")
+        if self._drain_id is not None:
+            self.root.after_cancel(self._drain_id)
         self.root.destroy()
     
     def check_adk_logs(self):
@@ -1839,7 +2282,7 @@ class ModernTkinterApp:
         
         self.session_running = True
         self.session_paused = False
-        self.session_start_time = datetime.now()
+        self.session_start_time = time.monotonic()
         self.session_elapsed = 0
 
         # Disable Start Session button
@@ -1847,20 +2290,7 @@ class ModernTkinterApp:
 
         # Update UI
         self.session_subtitle.configure(text="Timer active. We're tracking posture, focus, and environmental distractions.")
-        self.pause_btn.configure(
-            state="normal",
-            fg=self.colors['ink'],
-            bg=self.colors['card'],
-            activebackground=self.colors['panel']
-        )
-        self.stop_btn.configure(
-            state="normal",
-            fg=self.colors['ink'],
-            bg=self.colors['card'],
-            activebackground=self.colors['panel']
-        )
-        self.session_status_label.configure(text="Running")
-        self.status_dot.configure(fg=self.colors['danger'])
+        self._set_session_ui_state('running')
 
         # Start timer
         self.update_timer()
@@ -1877,22 +2307,18 @@ class ModernTkinterApp:
             print("⏸️ Pausing session - stopping camera monitoring...")
             self.pause_camera_monitoring()
             
-            self.session_elapsed += (datetime.now() - self.session_start_time).total_seconds()
+            self.session_elapsed += time.monotonic() - self.session_start_time
             self.session_subtitle.configure(text="Session paused - camera monitoring stopped.")
-            self.pause_btn.configure(text="Resume")
-            self.session_status_label.configure(text="Paused")
-            self.status_dot.configure(fg=self.colors['warn'])
-            self.status_label.configure(text="🟡 Session Paused")
+            self._set_session_ui_state('paused')
+            self._set_status("🟡 Session Paused")
         else:
             # Restart ADK system when resumed (turns on camera)
             print("▶️ Resuming session - restarting camera monitoring...")
             self.start_adk_production()
             
-            self.session_start_time = datetime.now()
+            self.session_start_time = time.monotonic()
             self.session_subtitle.configure(text="Session resumed - camera monitoring active!")
-            self.pause_btn.configure(text="Pause")
-            self.session_status_label.configure(text="Running")
-            self.status_dot.configure(fg=self.colors['danger'])
+            self._set_session_ui_state('running')
         
         self.update_timer()
     
@@ -1901,9 +2327,11 @@ class ModernTkinterApp:
         if not self.session_running:
             return
         
+        from tkinter import messagebox
+        
         # Calculate total time
         if not self.session_paused:
-            self.session_elapsed += (datetime.now() - self.session_start_time).total_seconds()
+            self.session_elapsed += time.monotonic() - self.session_start_time
         
         # Stop ADK production system (turns off camera)
         print("🛑 Stopping session - shutting down camera monitoring...")
@@ -1918,24 +2346,11 @@ class ModernTkinterApp:
 
         # Update UI
         self.session_subtitle.configure(text="Session stopped - camera monitoring disabled. Ready for next session.")
-        self.pause_btn.configure(
-            state="disabled",
-            text="Pause",
-            fg=self.colors['muted'],
-            bg=self.colors['panel']
-        )
-        self.stop_btn.configure(
-            state="disabled",
-            fg=self.colors['muted'],
-            bg=self.colors['panel']
-        )
-        self.session_status_label.configure(text="Idle")
-        self.status_dot.configure(fg=self.colors['accent2'])
-        self.timer_label.configure(text="00:00")
+        self._set_session_ui_state('idle')
+        self._set_text(self.timer_label, "00:00")
         
         # Show session summary
-        minutes = int(self.session_elapsed // 60)
-        seconds = int(self.session_elapsed % 60)
+        minutes, seconds = divmod(int(self.session_elapsed), 60)
 
         if minutes > 0:
             messagebox.showinfo(
@@ -1951,95 +2366,195 @@ class ModernTkinterApp:
                 "Session was too short to save (< 1 minute)."
             )
         # Always clear timer label after session
-        self.timer_label.configure(text="00:00")
+        self._set_text(self.timer_label, "00:00")
         self.session_elapsed = 0
     
+    def _set_session_ui_state(self, state):
+        """Apply session controls and status indicator for 'running', 'paused' or 'idle'"""
+        if state == 'idle':
+            button_opts = {'state': "disabled", 'fg': self.colors['muted'], 'bg': self.colors['panel']}
+        else:
+            button_opts = {
+                'state': "normal",
+                'fg': self.colors['ink'],
+                'bg': self.colors['card'],
+                'activebackground': self.colors['panel']
+            }
+        label, dot = {
+            'running': ("Running", self.colors['danger']),
+            'paused': ("Paused", self.colors['warn']),
+            'idle': ("Idle", self.colors['accent2'])
+        }[state]
+        
+        # One configure per widget, each a single Tcl command
+        self.pause_btn.configure(text="Resume" if state == 'paused' else "Pause", **button_opts)
+        self.stop_btn.configure(**button_opts)
+        self.session_status_label.configure(text=label)
+        self.status_dot.configure(fg=dot)
+    
     def update_timer(self):
         """Update the session timer"""
+        # Pause/resume call this directly; drop the pending tick so only one chain runs
+        if self.timer_id is not None:
+            self.root.after_cancel(self.timer_id)
+            self.timer_id = None
+        
         if self.session_running and not self.session_paused:
-            current_elapsed = self.session_elapsed + (datetime.now() - self.session_start_time).total_seconds()
+            current_elapsed = self.session_elapsed + (time.monotonic() - self.session_start_time)
         else:
             current_elapsed = self.session_elapsed
         
-        minutes = int(current_elapsed // 60)
-        seconds = int(current_elapsed % 60)
+        minutes, seconds = divmod(int(current_elapsed), 60)
         
-        self.timer_label.configure(text=f"{minutes:02d}:{seconds:02d}")
+        self._set_text(self.timer_label, f"{minutes:02d}:{seconds:02d}")
         
         if self.session_running:
-            self.timer_id = self.root.after(1000, self.update_timer)
+            # Fire just after the next whole second of elapsed time to avoid drift
+            delay = 1000 - int(current_elapsed * 1000) % 1000
+            self.timer_id = self.root.after(delay, self.update_timer)
     
     def show_settings(self):
         """Show settings dialog"""
+        # The dialog is built once and hidden on close
+        if self._settings_window is None:
+            self._build_settings_window()
+        
+        settings_window = self._settings_window
+        self._settings_refresh_var.set(self.auto_refresh)
+        settings_window.deiconify()
+        # A grab needs the window to be mapped first
+        settings_window.wait_visibility()
+        settings_window.grab_set()
+    
+    def _build_settings_window(self):
+        """Create the settings Toplevel and its widgets (withdrawn)"""
+        c = self.colors
+        card = c['card']
+        panel = c['panel']
+        ink = c['ink']
+        accent = c['accent']
+        accent_active = c['accent_active']
+        body_font = self.fonts['body']
+        
         settings_window = tk.Toplevel(self.root)
+        # Keep the window unmapped while it is built so layout resolves in one pass
+        settings_window.withdraw()
         settings_window.title("Settings")
         settings_window.geometry("350x300")
-        settings_window.configure(bg=self.colors['card'])
+        settings_window.configure(bg=card)
         settings_window.transient(self.root)
-        settings_window.grab_set()
         
-        content_frame = tk.Frame(settings_window, bg=self.colors['card'])
+        content_frame = tk.Frame(settings_window, bg=card)
         content_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        content_frame.grid_columnconfigure(0, weight=1)
         
         title_label = tk.Label(
             content_frame,
             text="Settings",
             font=self.fonts['subtitle'],
-            fg=self.colors['ink'],
-            bg=self.colors['card']
+            fg=ink,
+            bg=card
         )
-        title_label.pack(pady=(0, 20))
         
         # Auto refresh setting
-        refresh_frame = tk.Frame(content_frame, bg=self.colors['card'])
-        refresh_frame.pack(fill="x", pady=(0, 10))
-        
         refresh_label = tk.Label(
-            refresh_frame,
+            content_frame,
             text="Auto refresh data",
-            font=self.fonts['body'],
-            fg=self.colors['ink'],
-            bg=self.colors['card']
+            font=body_font,
+            fg=ink,
+            bg=card
         )
-        refresh_label.pack(anchor="w")
         
-        refresh_var = tk.BooleanVar(value=self.auto_refresh)
+        refresh_var = self._settings_refresh_var = tk.BooleanVar(value=self.auto_refresh)
         refresh_check = tk.Checkbutton(
-            refresh_frame,
+            content_frame,
             text="Enable automatic data refresh",
             variable=refresh_var,
-            font=self.fonts['body'],
-            fg=self.colors['ink'],
-            bg=self.colors['card'],
-            selectcolor=self.colors['panel'],
-            activebackground=self.colors['card'],
-            activeforeground=self.colors['ink'],
+            font=body_font,
+            fg=ink,
+            bg=card,
+            selectcolor=panel,
+            activebackground=card,
+            activeforeground=ink,
             command=lambda: setattr(self, 'auto_refresh', refresh_var.get())
         )
-        refresh_check.pack(anchor="w", pady=(5, 0))
 
         # Close button
         def save_and_close():
             self.setup_refresh_timer()
-            settings_window.destroy()
+            settings_window.grab_release()
+            settings_window.withdraw()
         close_btn = tk.Button(
             content_frame,
             text="Close",
-            font=self.fonts['body'],
+            font=body_font,
             fg="white",
-            bg=self.colors['accent'],
+            bg=accent,
             relief='flat',
             bd=0,
-            activebackground="#3730a3",
+            activebackground=accent_active,
             activeforeground="white",
             command=save_and_close
         )
-        close_btn.pack(pady=(20, 0))
+        
+        # Lay out all rows at once
+        title_label.grid(row=0, column=0, pady=(0, 20))
+        refresh_label.grid(row=1, column=0, sticky="w")
+        refresh_check.grid(row=2, column=0, sticky="w", pady=(5, 10))
+        close_btn.grid(row=3, column=0, pady=(20, 0))
+        
+        settings_window.protocol("WM_DELETE_WINDOW", save_and_close)
+        settings_window.update_idletasks()
+        self._settings_window = settings_window
     
+    @throttle(250)
     def show_error(self, message: str):
         """Show error message"""
-        messagebox.showerror("Error", message)
-        self.status_label.configure(text="🔴 Error")
+        # Don't repeat the same toast while the backend keeps failing
+        if message != self._last_err_msg:
+            self._last_err_msg = message
+            self.root.after_idle(self._render_error_toast, message)
+        self._set_status("🔴 Error")
+    
+    def _render_error_toast(self, message: str):
+        """Show a non-modal error toast in the top-right corner of the window"""
+        if self._error_toast is None:
+            toast = tk.Toplevel(self.root)
+            toast.withdraw()
+            toast.overrideredirect(True)
+            toast.configure(bg=self.colors['danger'])
+            
+            label = tk.Label(
+                toast,
+                font=self.fonts['body'],
+                fg="white",
+                bg=self.colors['danger'],
+                wraplength=320,
+                justify="left"
+            )
+            label.pack(padx=14, pady=10)
+            
+            toast.message_label = label
+            self._error_toast = toast
+        
+        toast = self._error_toast
+        toast.message_label.configure(text=f"⚠️ {message}")
+        toast.update_idletasks()
+        x = self.root.winfo_rootx() + self.root.winfo_width() - toast.winfo_reqwidth() - 20
+        y = self.root.winfo_rooty() + 20
+        toast.geometry(f"+{x}+{y}")
+        toast.deiconify()
+        toast.lift()
+        
+        # Restart the hide countdown for each new message
+        if self._error_toast_hide_id is not None:
+            self.root.after_cancel(self._error_toast_hide_id)
+        self._error_toast_hide_id = self.root.after(4000, self._hide_error_toast)
+    
+    def _hide_error_toast(self):
+        """Hide the error toast (kept for reuse)"""
+        self._error_toast_hide_id = None
+        self._error_toast.withdraw()
     
     def run(self):
         """Run the desktop application"""
@@ -2055,13 +2570,18 @@ class ModernTkinterApp:
             print(f"❌ Desktop app error: {e}")
 
 if __name__ == "__main__":
-    print("🖥️ iMPOSTURE Modern Desktop Dashboard - Pure Tkinter")
-    print("=" * 60)
-    print("🎯 Project: perfect-entry-473503-j1")
-    print("📊 Beautiful desktop interface")
-    print("🎨 Matching web UI design")
-    print("🔧 Pure Tkinter - no dependencies")
-    print("=" * 60)
+    # Emit the banner in one write; STRAIGHTUP_QUIET=1 skips it for packaged runs
+    if os.environ.get("STRAIGHTUP_QUIET") != "1":
+        sys.stdout.write("\n".join([
+            "🖥️ iMPOSTURE Modern Desktop Dashboard - Pure Tkinter",
+            "=" * 60,
+            "🎯 Project: perfect-entry-473503-j1",
+            "📊 Beautiful desktop interface",
+            "🎨 Matching web UI design",
+            "🔧 Pure Tkinter - no dependencies",
+            "=" * 60,
+        ]) + "\n")
+        sys.stdout.flush()
     
     app = ModernTkinterApp()
     app.run()
\ No newline at end of file